@@ -1,3 +1,4 @@
+import sys
 from asyncio.events import AbstractEventLoop
 from concurrent.futures import Executor
 from logging import DEBUG as DEBUG_LV
@@ -67,6 +68,10 @@ class CoqClient(Client):
         assert isinstance(nvim.loop, AbstractEventLoop)
         nvim.loop.set_debug(DEBUG)
         nvim.loop.set_default_executor(self._pool)
+        if sys.version_info >= (3, 12):
+            from asyncio import eager_task_factory
+
+            nvim.loop.set_task_factory(eager_task_factory)
 
         def cont() -> bool:
             rpc_atomic, specs = rpc.drain(nvim.channel_id)
@@ -2,9 +2,9 @@ from asyncio import CancelledError
 from concurrent.futures import Executor
 from os.path import normcase
 from pathlib import Path, PurePath
-from sqlite3 import Connection, OperationalError
+from sqlite3 import Connection, Cursor, OperationalError
 from threading import Lock
-from typing import AbstractSet, Iterator, Mapping, TypedDict, cast
+from typing import AbstractSet, Iterator, Mapping, Sequence, Tuple, TypedDict, cast
 from uuid import uuid4
 
 from std2.asyncio import to_thread
@@ -38,6 +38,49 @@ def _init(db_dir: Path) -> Connection:
     return conn
 
 
+def _populate(
+    cursor: Cursor, path: PurePath, mtime: float, loaded: LoadedSnips
+) -> None:
+    filename, source_id = normcase(path), uuid4().bytes
+    cursor.execute(sql("delete", "source"), {"filename": filename})
+    cursor.execute(
+        sql("insert", "source"),
+        {"rowid": source_id, "filename": filename, "mtime": mtime},
+    )
+
+    for src, dests in loaded.exts.items():
+        for dest in dests:
+            cursor.executemany(
+                sql("insert", "filetype"),
+                ({"filetype": src}, {"filetype": dest}),
+            )
+            cursor.execute(
+                sql("insert", "extension"),
+                {"source_id": source_id, "src": src, "dest": dest},
+            )
+
+    for uid, snippet in loaded.snippets.items():
+        snippet_id = uid.bytes
+        cursor.execute(sql("insert", "filetype"), {"filetype": snippet.filetype})
+        cursor.execute(
+            sql("insert", "snippet"),
+            {
+                "rowid": snippet_id,
+                "source_id": source_id,
+                "filetype": snippet.filetype,
+                "grammar": snippet.grammar.name,
+                "content": snippet.content,
+                "label": snippet.label,
+                "doc": snippet.doc,
+            },
+        )
+        for match in snippet.matches:
+            cursor.execute(
+                sql("insert", "match"),
+                {"snippet_id": snippet_id, "word": match},
+            )
+
+
 class SDB:
     def __init__(self, pool: Executor, vars_dir: Path) -> None:
         db_dir = vars_dir / "clients" / "snippets"
@@ -70,48 +113,15 @@ class SDB:
         return await to_thread(lambda: self._ex.submit(cont))
 
     async def populate(self, path: PurePath, mtime: float, loaded: LoadedSnips) -> None:
+        await self.populate_many(((path, mtime, loaded),))
+
+    async def populate_many(
+        self, items: Sequence[Tuple[PurePath, float, LoadedSnips]]
+    ) -> None:
         def cont() -> None:
             with self._lock, with_transaction(self._conn.cursor()) as cursor:
-                filename, source_id = normcase(path), uuid4().bytes
-                cursor.execute(sql("delete", "source"), {"filename": filename})
-                cursor.execute(
-                    sql("insert", "source"),
-                    {"rowid": source_id, "filename": filename, "mtime": mtime},
-                )
-
-                for src, dests in loaded.exts.items():
-                    for dest in dests:
-                        cursor.executemany(
-                            sql("insert", "filetype"),
-                            ({"filetype": src}, {"filetype": dest}),
-                        )
-                        cursor.execute(
-                            sql("insert", "extension"),
-                            {"source_id": source_id, "src": src, "dest": dest},
-                        )
-
-                for uid, snippet in loaded.snippets.items():
-                    snippet_id = uid.bytes
-                    cursor.execute(
-                        sql("insert", "filetype"), {"filetype": snippet.filetype}
-                    )
-                    cursor.execute(
-                        sql("insert", "snippet"),
-                        {
-                            "rowid": snippet_id,
-                            "source_id": source_id,
-                            "filetype": snippet.filetype,
-                            "grammar": snippet.grammar.name,
-                            "content": snippet.content,
-                            "label": snippet.label,
-                            "doc": snippet.doc,
-                        },
-                    )
-                    for match in snippet.matches:
-                        cursor.execute(
-                            sql("insert", "match"),
-                            {"snippet_id": snippet_id, "word": match},
-                        )
+                for path, mtime, loaded in items:
+                    _populate(cursor, path=path, mtime=mtime, loaded=loaded)
                 cursor.execute("PRAGMA optimize", ())
 
         await self._ex.asubmit(cont)
@@ -1,5 +1,4 @@
-from asyncio import Condition
-from collections import defaultdict
+from asyncio import Queue
 from dataclasses import dataclass
 from itertools import count
 from pathlib import Path
@@ -7,9 +6,10 @@ from typing import (
     AbstractSet,
     Any,
     AsyncIterator,
+    Callable,
+    Mapping,
     MutableMapping,
     Optional,
-    Sequence,
     Tuple,
 )
 
@@ -21,12 +21,13 @@ from ...registry import NAMESPACE, atomic, rpc
 from ...server.rt_types import Stack
 from ...shared.timeit import timeit
 
+_Reply = Optional[Tuple[Optional[str], Any]]
+
 
 @dataclass(frozen=True)
 class _Session:
     uid: int
-    done: bool
-    acc: Sequence[Tuple[Optional[str], Any]]
+    queue: "Queue[_Reply]"
 
 
 @dataclass(frozen=True)
@@ -42,45 +43,52 @@ class _Payload:
 _LUA = (Path(__file__).resolve(strict=True).parent / "lsp.lua").read_text("UTF-8")
 atomic.exec_lua(_LUA, ())
 
-_UIDS = count()
-_CONDS: MutableMapping[str, Condition] = {}
-_STATE: MutableMapping[str, _Session] = defaultdict(
-    lambda: _Session(uid=-1, done=True, acc=())
-)
+_UIDS = count(start=1)
+_SESSIONS: MutableMapping[str, _Session] = {}
 
 
 _DECODER = new_decoder[_Payload](_Payload)
 
+try:
+    from msgspec import convert
+except ImportError:
+    _CONVERT: Optional[Callable[..., _Payload]] = None
+else:
+    _CONVERT = convert
+
+
+def _decode(rpayload: Mapping[str, Any]) -> _Payload:
+    if _CONVERT:
+        return _CONVERT(rpayload, type=_Payload)
+    else:
+        return _DECODER(rpayload)
+
 
 @rpc(blocking=False)
-def _lsp_notify(nvim: Nvim, stack: Stack, rpayload: _Payload) -> None:
-    async def cont() -> None:
-        payload = _DECODER(rpayload)
-        cond = _CONDS.setdefault(payload.name, Condition())
-
-        acc = _STATE[payload.name]
-        if payload.uid >= acc.uid:
-            _STATE[payload.name] = _Session(
-                uid=payload.uid,
-                done=payload.done,
-                acc=(*acc.acc, (payload.client, payload.reply)),
-            )
-        async with cond:
-            cond.notify_all()
+def _lsp_notify(nvim: Nvim, stack: Stack, rpayload: Mapping[str, Any]) -> None:
+    session = _SESSIONS.get(rpayload.get("name", ""))
+    if session and session.uid == rpayload.get("uid"):
+
+        async def cont() -> None:
+            assert session
+            payload = _decode(rpayload)
+            session.queue.put_nowait((payload.client, payload.reply))
+            if payload.done:
+                session.queue.put_nowait(None)
 
-    go(nvim, aw=cont())
+        go(nvim, aw=cont())
 
 
 async def async_request(
     nvim: Nvim, name: str, clients: AbstractSet[str], *args: Any
 ) -> AsyncIterator[Tuple[Optional[str], Any]]:
     with timeit(f"LSP :: {name}"):
-        cond = _CONDS.setdefault(name, Condition())
-
         uid = next(_UIDS)
-        _STATE[name] = _Session(uid=uid, done=False, acc=())
-        async with cond:
-            cond.notify_all()
+        session = _Session(uid=uid, queue=Queue())
+
+        if prev := _SESSIONS.get(name):
+            prev.queue.put_nowait(None)
+        _SESSIONS[name] = session
 
         def cont() -> None:
             nvim.api.exec_lua(
@@ -88,18 +96,11 @@ async def async_request(
                 (name, uid, tuple(clients), *args),
             )
 
-        await async_call(nvim, cont)
-
-        while True:
-            acc = _STATE[name]
-            if acc.uid == uid:
-                _STATE[name] = _Session(uid=acc.uid, done=acc.done, acc=())
-                for client, a in acc.acc:
-                    yield client, a
-                if acc.done:
-                    break
-            elif acc.uid > uid:
-                break
-
-            async with cond:
-                await cond.wait()
+        try:
+            await async_call(nvim, cont)
+
+            while reply := await session.queue.get():
+                yield reply
+        finally:
+            if _SESSIONS.get(name) is session:
+                _SESSIONS.pop(name, None)
@@ -1,8 +1,29 @@
-from asyncio import Event, Lock, Task, gather, sleep, wait
+from asyncio import (
+    Handle,
+    Lock,
+    Queue,
+    Task,
+    gather,
+    sleep,
+    wait,
+)
 from asyncio.events import AbstractEventLoop
 from dataclasses import replace
+from math import inf
 from queue import SimpleQueue
-from typing import Any, Literal, Mapping, Optional, Sequence, Tuple, Union
+from time import monotonic
+from typing import (
+    Any,
+    Callable,
+    Literal,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 from uuid import UUID, uuid4
 
 from pynvim import Nvim
@@ -24,6 +45,7 @@ from std2.pickle.types import DecodeError
 from ...lsp.requests.command import cmd
 from ...lsp.requests.resolve import resolve
 from ...registry import NAMESPACE, AUGROUPS, atomic, autocmd, rpc
+from ...shared.lru import LRU
 from ...shared.runtime import Metric
 from ...shared.timeit import timeit
 from ...shared.types import Context, ExternLSP, ExternPath
@@ -34,7 +56,15 @@ from ..rt_types import Stack
 from ..state import State, state
 from ..trans import trans
 
+_DEBOUNCE = 0.020
+
 _Q: SimpleQueue = SimpleQueue()
+_WAKE: Optional[Callable[[State, bool], None]] = None
+_HANDLE: Optional[Handle] = None
+
+_RESOLVE_TTL = 1.0
+_RESOLVE_INFLIGHT: MutableMapping[UUID, Task] = {}
+_RESOLVE_MISSES: MutableMapping[UUID, float] = LRU(size=100)
 
 
 def _should_cont(state: State, prev: Context, cur: Context) -> bool:
@@ -57,10 +87,16 @@ def _should_cont(state: State, prev: Context, cur: Context) -> bool:
 @rpc(blocking=True)
 def _launch_loop(nvim: Nvim, stack: Stack) -> None:
     task: Optional[Task] = None
-    incoming: Optional[Tuple[State, bool]] = None
 
     async def cont() -> None:
-        lock, event = Lock(), Event()
+        global _WAKE
+        lock = Lock()
+        incoming: "Queue[Tuple[State, bool]]" = Queue(maxsize=1)
+
+        def wake(s: State, manual: bool) -> None:
+            if incoming.full():
+                incoming.get_nowait()
+            incoming.put_nowait((s, manual))
 
         async def c0(s: State, manual: bool) -> None:
             with with_suppress(), timeit("**OVERALL**"):
@@ -81,6 +117,10 @@ def _launch_loop(nvim: Nvim, stack: Stack) -> None:
                     _, col = ctx.position
 
                     if should:
+                        fast_close = (
+                            stack.settings.display.pum.fast_close
+                            and state().last_shown_count > 0
+                        )
                         state(context=ctx)
                         await stack.supervisor.interrupt()
                         metrics, _ = await gather(
@@ -89,10 +129,10 @@ def _launch_loop(nvim: Nvim, stack: Stack) -> None:
                                 nvim,
                                 lambda: complete(nvim, stack=stack, col=col, comps=()),
                             )
-                            if stack.settings.display.pum.fast_close
+                            if fast_close
                             else sleep(0),
                         )
-                        s = state()
+                        s = state(last_shown_count=0) if fast_close else state()
                         if s.change_id == ctx.change_id:
                             vim_comps = tuple(
                                 trans(
@@ -102,6 +142,7 @@ def _launch_loop(nvim: Nvim, stack: Stack) -> None:
                                     metrics=metrics,
                                 )
                             )
+                            state(last_shown_count=len(vim_comps))
                             await async_call(
                                 nvim,
                                 lambda: complete(
@@ -112,30 +153,27 @@ def _launch_loop(nvim: Nvim, stack: Stack) -> None:
                         await async_call(
                             nvim, lambda: complete(nvim, stack=stack, col=col, comps=())
                         )
-                        state(inserted_pos=(-1, -1))
+                        state(inserted_pos=(-1, -1), last_shown_count=0)
 
         async def c1() -> None:
-            nonlocal incoming
             while True:
                 with with_suppress():
-                    incoming = await to_thread(_Q.get)
-                    event.set()
+                    s, manual = await to_thread(_Q.get)
+                    wake(s, manual=manual)
 
         async def c2() -> None:
             nonlocal task
             while True:
                 with with_suppress():
-                    await event.wait()
-                    event.clear()
+                    s, manual = await incoming.get()
 
                     if task:
                         await cancel(task)
 
-                    if incoming:
-                        assert isinstance(nvim.loop, AbstractEventLoop)
-                        s, manual = incoming
-                        task = nvim.loop.create_task(c0(s, manual=manual))
+                    assert isinstance(nvim.loop, AbstractEventLoop)
+                    task = nvim.loop.create_task(c0(s, manual=manual))
 
+        _WAKE = wake
         await gather(c1(), c2())
 
     go(nvim, aw=cont())
@@ -144,8 +182,26 @@ def _launch_loop(nvim: Nvim, stack: Stack) -> None:
 atomic.exec_lua(f"{NAMESPACE}.{_launch_loop.name}()", ())
 
 
+def _debounce(nvim: Nvim, s: State, manual: bool) -> None:
+    global _HANDLE
+    if _HANDLE:
+        _HANDLE.cancel()
+        _HANDLE = None
+
+    if _WAKE:
+        if manual:
+            _WAKE(s, manual)
+        else:
+            assert isinstance(nvim.loop, AbstractEventLoop)
+            _HANDLE = nvim.loop.call_later(_DEBOUNCE, _WAKE, s, manual)
+
+
 def comp_func(nvim: Nvim, s: State, manual: bool) -> None:
-    _Q.put((s, manual))
+    if not _WAKE:
+        _Q.put((s, manual))
+    else:
+        assert isinstance(nvim.loop, AbstractEventLoop)
+        nvim.loop.call_soon_threadsafe(_debounce, nvim, s, manual)
 
 
 @rpc(blocking=True)
@@ -164,25 +220,38 @@ async def _resolve(nvim: Nvim, stack: Stack, metric: Metric) -> Metric:
     if not isinstance((extern := metric.comp.extern), ExternLSP):
         return metric
     else:
-        if comp := stack.lru.get(metric.comp.uid):
+        uid = metric.comp.uid
+        if not (comp := stack.lru.get(uid)):
+            if monotonic() - _RESOLVE_MISSES.get(uid, -inf) < _RESOLVE_TTL:
+                return metric
+
+            if not (task := _RESOLVE_INFLIGHT.get(uid)):
+                task = cast(Task, go(nvim, aw=resolve(nvim, extern=extern)))
+                _RESOLVE_INFLIGHT[uid] = task
+
+                def cb(t: Task) -> None:
+                    _RESOLVE_INFLIGHT.pop(uid, None)
+                    if not t.cancelled():
+                        if t.exception():
+                            _RESOLVE_MISSES[uid] = monotonic()
+                        elif resolved := t.result():
+                            _RESOLVE_MISSES.pop(uid, None)
+                            stack.lru[uid] = resolved
+
+                task.add_done_callback(cb)
+
+            done, _ = await wait(
+                (task,), timeout=stack.settings.clients.lsp.resolve_timeout
+            )
+            comp = (await done.pop()) if done else None
+
+        if not comp:
+            return metric
+        else:
             return replace(
                 metric,
                 comp=replace(metric.comp, secondary_edits=comp.secondary_edits),
             )
-        else:
-            done, not_done = await wait(
-                (go(nvim, aw=resolve(nvim, extern=extern)),),
-                timeout=stack.settings.clients.lsp.resolve_timeout,
-            )
-            await cancel(gather(*not_done))
-            comp = (await done.pop()) if done else None
-            if not comp:
-                return metric
-            else:
-                return replace(
-                    metric,
-                    comp=replace(metric.comp, secondary_edits=comp.secondary_edits),
-                )
 
 
 _UDECODER = new_decoder[UUID](UUID)
@@ -204,6 +273,7 @@ def _comp_done(nvim: Nvim, stack: Stack, event: Mapping[str, Any]) -> None:
                 ns = create_ns(nvim, ns=NS)
                 clear_ns(nvim, buf=buf, id=ns)
                 before, *_ = buf_get_lines(nvim, buf=buf, lo=row, hi=row + 1)
+                end = len(before) if before.isascii() else len(encode(before))
                 e1 = ExtMark(
                     idx=1,
                     begin=(row, 0),
@@ -213,7 +283,7 @@ def _comp_done(nvim: Nvim, stack: Stack, event: Mapping[str, Any]) -> None:
                 e2 = ExtMark(
                     idx=2,
                     begin=(row, col),
-                    end=(row, len(encode(before))),
+                    end=(row, end),
                     meta={},
                 )
                 buf_set_extmarks(nvim, buf=buf, id=ns, marks=(e1, e2))
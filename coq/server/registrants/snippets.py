@@ -6,19 +6,23 @@ from datetime import datetime
 from itertools import chain
 from json import JSONDecodeError, dumps, loads
 from math import inf
-from os import linesep
+from os import linesep, scandir, stat
 from os.path import expanduser, expandvars
 from pathlib import Path, PurePath
 from posixpath import normcase
+from sqlite3 import DatabaseError
 from string import Template
 from tempfile import NamedTemporaryFile
 from textwrap import dedent
+from types import ModuleType
 from typing import (
     AbstractSet,
     Any,
     Iterable,
     Iterator,
     Mapping,
+    MutableSequence,
+    MutableSet,
     Optional,
     Sequence,
     Tuple,
@@ -28,9 +32,8 @@ from pynvim.api.nvim import Nvim
 from pynvim_pp.api import get_cwd, iter_rtps
 from pynvim_pp.lib import async_call, awrite, go
 from pynvim_pp.logging import log
-from std2.asyncio import to_thread
+from std2.asyncio import cancel, to_thread
 from std2.graphlib import recur_sort
-from std2.pathlib import walk
 from std2.pickle.decoder import new_decoder
 from std2.pickle.encoder import new_encoder
 from std2.pickle.types import DecodeError
@@ -49,10 +52,33 @@ from ...snippets.parsers.types import ParseInfo
 from ...snippets.types import SCHEMA, LoadedSnips, ParsedSnippet
 from ..rt_types import Stack
 
+try:
+    import orjson
+except ImportError:
+    _ORJSON: Optional[ModuleType] = None
+else:
+    _ORJSON = orjson
+
 BUNDLED_PATH_TPL = Template("coq+snippets+${schema}.json")
 _USER_PATH_TPL = Template("users+${schema}.json")
+_BUNDLED_NAME = BUNDLED_PATH_TPL.substitute(schema=SCHEMA)
+_USER_NAME = _USER_PATH_TPL.substitute(schema=SCHEMA)
 _SUB_PATH = PurePath("clients", "snippets")
 
+_LOAD_FAIL_TPL = Template(
+    dedent(
+        """
+        Failed to load compiled snips
+        ${e}
+        """
+    ).rstrip()
+)
+
+_LOADED_DECODER = new_decoder[LoadedSnips](LoadedSnips)
+_LOADED_ENCODER = new_encoder[LoadedSnips](LoadedSnips)
+_MTIMES_DECODER = new_decoder[Mapping[Path, float]](Mapping[Path, float])
+_MTIMES_ENCODER = new_encoder[Mapping[Path, float]](Mapping[Path, float])
+
 
 @dataclass(frozen=True)
 class Compiled:
@@ -62,19 +88,15 @@ class Compiled:
     parsed: Sequence[Tuple[ParsedSnippet, Edit, Sequence[Mark]]]
 
 
-async def _bundled_mtimes(
-    nvim: Nvim,
-) -> Mapping[Path, float]:
-    rtp = await async_call(nvim, lambda: tuple(iter_rtps(nvim)))
-
+async def _bundled_mtimes(rtp: Sequence[Path]) -> Mapping[Path, float]:
     def c1() -> Iterator[Tuple[Path, float]]:
         for path in rtp:
-            json = path / BUNDLED_PATH_TPL.substitute(schema=SCHEMA)
+            json = path / _BUNDLED_NAME
             with suppress(OSError):
                 mtime = json.stat().st_mtime
                 yield json, mtime
 
-    return {p: m for p, m in await to_thread(lambda: tuple(c1()))}
+    return await to_thread(lambda: {p: m for p, m in c1()})
 
 
 def _resolve(stdp: Path, path: Path) -> Optional[Path]:
@@ -98,48 +120,68 @@ def _resolve(stdp: Path, path: Path) -> Optional[Path]:
             return _resolve(stdp, path=stdp / path)
 
 
+def _snippet_paths(
+    nvim: Nvim, user_path: Optional[Path], rtp: Iterable[Path]
+) -> Iterator[Path]:
+    if user_path:
+        std_conf = Path(nvim.funcs.stdpath("config"))
+        if resolved := _resolve(std_conf, path=user_path):
+            yield resolved
+    for path in rtp:
+        yield path / "coq-user-snippets"
+
+
 async def snippet_paths(nvim: Nvim, user_path: Optional[Path]) -> Sequence[Path]:
-    def cont() -> Iterator[Path]:
-        if user_path:
-            std_conf = Path(nvim.funcs.stdpath("config"))
-            if resolved := _resolve(std_conf, path=user_path):
-                yield resolved
-        for path in iter_rtps(nvim):
-            yield path / "coq-user-snippets"
-
-    paths = await async_call(nvim, lambda: tuple(cont()))
+    def cont() -> Sequence[Path]:
+        return tuple(_snippet_paths(nvim, user_path=user_path, rtp=iter_rtps(nvim)))
+
+    paths = await async_call(nvim, cont)
     return paths
 
 
-async def user_mtimes(
-    nvim: Nvim, user_path: Optional[Path]
-) -> Tuple[Sequence[Path], Mapping[Path, float]]:
-    paths = await snippet_paths(nvim, user_path=user_path)
+def _scan_snips(root: Path) -> Iterator[Tuple[Path, float]]:
+    seen: MutableSet[Tuple[int, int]] = set()
+    stack = [str(root)]
+    while stack:
+        path = stack.pop()
+        st = stat(path)
+        if (st.st_dev, st.st_ino) not in seen:
+            seen.add((st.st_dev, st.st_ino))
+            with scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".snip"):
+                        yield Path(entry.path), entry.stat().st_mtime
 
+
+async def _user_mtimes(paths: Sequence[Path]) -> Mapping[Path, float]:
     def cont() -> Iterator[Tuple[Path, float]]:
         for path in paths:
             with suppress(OSError):
-                for p in walk(path):
-                    if p.suffix in {".snip"}:
-                        mtime = p.stat().st_mtime
-                        yield p, mtime
+                yield from _scan_snips(path)
 
-    return paths, {p: m for p, m in await to_thread(lambda: tuple(cont()))}
+    return await to_thread(lambda: {p: m for p, m in cont()})
+
+
+async def user_mtimes(
+    nvim: Nvim, user_path: Optional[Path]
+) -> Tuple[Sequence[Path], Mapping[Path, float]]:
+    paths = await snippet_paths(nvim, user_path=user_path)
+    return paths, await _user_mtimes(paths)
 
 
 def _paths(vars_dir: Path) -> Tuple[Path, Path]:
-    compiled = vars_dir / _SUB_PATH / _USER_PATH_TPL.substitute(schema=SCHEMA)
+    compiled = vars_dir / _SUB_PATH / _USER_NAME
     meta = vars_dir / _SUB_PATH / "meta.json"
     return compiled, meta
 
 
 async def _load_compiled(path: Path, mtime: float) -> Tuple[Path, float, LoadedSnips]:
-    decoder = new_decoder[LoadedSnips](LoadedSnips)
-
     def cont() -> LoadedSnips:
         raw = path.read_text("UTF-8")
         json = loads(raw)
-        loaded = decoder(json)
+        loaded = _LOADED_DECODER(json)
         return loaded
 
     return path, mtime, await to_thread(cont)
@@ -161,7 +203,7 @@ async def _load_user_compiled(
             raw = meta.read_text("UTF-8")
             try:
                 json = loads(raw)
-                m2 = new_decoder[Mapping[Path, float]](Mapping[Path, float])(json)
+                m2 = _MTIMES_DECODER(json)
             except (JSONDecodeError, DecodeError):
                 meta.unlink(missing_ok=True)
 
@@ -171,15 +213,21 @@ async def _load_user_compiled(
 
 
 def jsonify(o: Any) -> str:
-    json = dumps(recur_sort(o), check_circular=False, ensure_ascii=False, indent=2)
-    return json
+    sorted_o = recur_sort(o)
+    if _ORJSON:
+        raw = _ORJSON.dumps(sorted_o, option=_ORJSON.OPT_INDENT_2)
+        json: str = raw.decode("UTF-8")
+        return json
+    else:
+        json = dumps(sorted_o, check_circular=False, ensure_ascii=False, indent=2)
+        return json
 
 
 async def _dump_compiled(
     vars_dir: Path, mtimes: Mapping[Path, float], loaded: LoadedSnips
 ) -> None:
-    m_json = jsonify(new_encoder[Mapping[Path, float]](Mapping[Path, float])(mtimes))
-    s_json = jsonify(new_encoder[LoadedSnips](LoadedSnips)(loaded))
+    m_json = jsonify(_MTIMES_ENCODER(mtimes))
+    s_json = jsonify(_LOADED_ENCODER(loaded))
 
     compiled, meta = _paths(vars_dir)
     for path, json in ((compiled, s_json), (meta, m_json)):
@@ -211,17 +259,27 @@ def _trans(
 
 async def _slurp(nvim: Nvim, stack: Stack, warn: AbstractSet[SnippetWarnings]) -> None:
     with timeit("LOAD SNIPS"):
+
+        def c0() -> Tuple[PurePath, Sequence[Path], Sequence[Path]]:
+            cwd = get_cwd(nvim)
+            rtp = tuple(iter_rtps(nvim))
+            snip_dirs = tuple(
+                _snippet_paths(
+                    nvim, user_path=stack.settings.clients.snippets.user_path, rtp=rtp
+                )
+            )
+            return cwd, rtp, snip_dirs
+
+        cwd, rtp, snip_dirs = await async_call(nvim, c0)
         (
-            cwd,
             bundled,
             (user_compiled, user_compiled_mtimes),
-            (_, user_snips_mtimes),
+            user_snips_mtimes,
             mtimes,
         ) = await gather(
-            async_call(nvim, get_cwd, nvim),
-            _bundled_mtimes(nvim),
+            _bundled_mtimes(rtp),
             _load_user_compiled(stack.supervisor.vars_dir),
-            user_mtimes(nvim, user_path=stack.settings.clients.snippets.user_path),
+            _user_mtimes(snip_dirs),
             stack.sdb.mtimes(),
         )
 
@@ -241,32 +299,48 @@ async def _slurp(nvim: Nvim, stack: Stack, warn: AbstractSet[SnippetWarnings]) -
             for path, mtime in user_snips_mtimes.items()
             if mtime > user_compiled_mtimes.get(path, -inf)
         }
+        loading = tuple(
+            go(nvim, aw=_load_compiled(path, mtime))
+            for path, mtime in compiled.items()
+        )
 
-        await stack.sdb.clean(stale)
-        if SnippetWarnings.missing in warn and not (bundled or user_compiled):
-            await sleep(0)
-            await awrite(nvim, LANG("fs snip load empty"))
-
-        for fut in as_completed(
-            tuple(_load_compiled(path, mtime) for path, mtime in compiled.items())
-        ):
+        snips: MutableSequence[Tuple[Path, float, LoadedSnips]] = []
+        try:
+            await stack.sdb.clean(stale)
+            if SnippetWarnings.missing in warn and not (bundled or user_compiled):
+                await sleep(0)
+                await awrite(nvim, LANG("fs snip load empty"))
+
+            for fut in as_completed(loading):
+                try:
+                    snips.append(await fut)
+                except (OSError, JSONDecodeError, DecodeError) as e:
+                    log.warn("%s", _LOAD_FAIL_TPL.substitute(e=type(e)))
+        finally:
+            await cancel(gather(*loading, return_exceptions=True))
+
+        populated: MutableSequence[Path] = []
+        if snips:
             try:
-                path, mtime, loaded = await fut
-            except (OSError, JSONDecodeError, DecodeError) as e:
-                tpl = """
-                Failed to load compiled snips
-                ${e}
-                """.rstrip()
-                log.warn("%s", Template(dedent(tpl)).substitute(e=type(e)))
+                await stack.sdb.populate_many(snips)
+            except DatabaseError as e:
+                log.warn("%s", e)
+                for path, mtime, loaded in snips:
+                    try:
+                        await stack.sdb.populate(path, mtime=mtime, loaded=loaded)
+                    except DatabaseError as e:
+                        log.warn("%s", e)
+                    else:
+                        populated.append(path)
             else:
-                await stack.sdb.populate(path, mtime=mtime, loaded=loaded)
-                await awrite(
-                    nvim,
-                    LANG(
-                        "fs snip load succ",
-                        path=fmt_path(cwd, path=path, is_dir=False),
-                    ),
-                )
+                populated.extend(path for path, _, _ in snips)
+
+        if populated:
+            pretty = tuple(fmt_path(cwd, path=path, is_dir=False) for path in populated)
+            await awrite(
+                nvim,
+                LANG("fs snip load succ", n=len(pretty), paths=linesep.join(pretty)),
+            )
 
         if SnippetWarnings.outdated in warn and new_user_snips:
             paths = linesep.join(
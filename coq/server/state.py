@@ -27,6 +27,7 @@ class State:
     last_edit: Metric
     inserted_pos: NvimPos
     pum_location: Optional[int]
+    last_shown_count: int
 
 
 _LOCK = Lock()
@@ -63,6 +64,7 @@ _state = State(
     ),
     inserted_pos=(-1, -1),
     pum_location=None,
+    last_shown_count=0,
 )
 
 
@@ -78,6 +80,7 @@ def state(
     last_edit: Optional[Metric] = None,
     inserted_pos: Optional[NvimPos] = None,
     pum_location: Union[VoidType, Optional[int]] = Void,
+    last_shown_count: Optional[int] = None,
 ) -> State:
     global _state
 
@@ -96,6 +99,9 @@ def state(
             pum_location=pum_location
             if not isinstance(pum_location, VoidType)
             else _state.pum_location,
+            last_shown_count=last_shown_count
+            if last_shown_count is not None
+            else _state.last_shown_count,
         )
         _state = state
 
@@ -1,7 +1,8 @@
+from collections import deque
 from concurrent.futures import Executor, Future, InvalidStateError
 from contextlib import suppress
-from queue import SimpleQueue
-from typing import Any, Callable, TypeVar, cast
+from threading import Event, get_ident
+from typing import Any, Callable, Optional, TypeVar, cast
 
 from std2.asyncio import to_thread
 
@@ -10,15 +11,24 @@ _T = TypeVar("_T")
 
 class SingleThreadExecutor:
     def __init__(self, pool: Executor) -> None:
-        self._q: SimpleQueue = SimpleQueue()
+        self._q: deque = deque()
+        self._ev = Event()
+        self._ident: Optional[int] = None
         pool.submit(self._forever)
 
     def _forever(self) -> None:
+        self._ident = get_ident()
         while True:
-            f = self._q.get()
-            f()
+            self._ev.wait()
+            self._ev.clear()
+            while self._q:
+                f = self._q.popleft()
+                f()
 
     def submit(self, f: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        if get_ident() == self._ident:
+            return f(*args, **kwargs)
+
         fut: Future = Future()
 
         def cont() -> None:
@@ -31,7 +41,8 @@ class SingleThreadExecutor:
                 with suppress(InvalidStateError):
                     fut.set_result(ret)
 
-        self._q.put(cont)
+        self._q.append(cont)
+        self._ev.set()
         return cast(_T, fut.result())
 
     async def asubmit(self, f: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
@@ -1,8 +1,9 @@
 from collections import OrderedDict, UserDict
-from typing import Generic, TypeVar, cast
+from typing import Generic, Optional, TypeVar, Union, cast, overload
 
 K = TypeVar("K")
 V = TypeVar("V")
+T = TypeVar("T")
 
 
 class LRU(UserDict, Generic[K, V]):
@@ -11,7 +12,22 @@ class LRU(UserDict, Generic[K, V]):
         self._size = size
         self.data = OrderedDict()
 
+    @overload
+    def get(self, key: K) -> Optional[V]:
+        ...
+
+    @overload
+    def get(self, key: K, default: Union[V, T]) -> Union[V, T]:
+        ...
+
+    def get(self, key: K, default: Optional[T] = None) -> Union[V, T, None]:
+        if key in self.data:
+            cast(OrderedDict, self.data).move_to_end(key)
+            return cast(V, self.data[key])
+        else:
+            return default
+
     def __setitem__(self, key: K, item: V) -> None:
-        if len(self) >= self._size:
+        if key not in self and len(self) >= self._size:
             cast(OrderedDict, self.data).popitem(last=False)
         return super().__setitem__(key, item)
@@ -0,0 +1,45 @@
+from os import symlink
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from ...coq.server.registrants.snippets import _scan_snips
+
+
+class ScanSnips(TestCase):
+    def test_1(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "a" / "b").mkdir(parents=True)
+            for path in (root / "x.snip", root / "a" / "b" / "y.snip", root / "z.txt"):
+                path.touch()
+
+            found = {path for path, _ in _scan_snips(root)}
+            self.assertEqual(found, {root / "x.snip", root / "a" / "b" / "y.snip"})
+
+    def test_2(self) -> None:
+        with TemporaryDirectory() as tmp, TemporaryDirectory() as other:
+            root = Path(tmp)
+            (Path(other) / "q.snip").touch()
+            symlink(other, root / "linked", target_is_directory=True)
+
+            found = tuple(path for path, _ in _scan_snips(root))
+            self.assertEqual(found, (root / "linked" / "q.snip",))
+
+    def test_3(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "a").mkdir()
+            (root / "a" / "x.snip").touch()
+            symlink(root, root / "a" / "loop", target_is_directory=True)
+
+            found = tuple(path for path, _ in _scan_snips(root))
+            self.assertEqual(found, (root / "a" / "x.snip",))
+
+    def test_4(self) -> None:
+        with TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "x.snip").touch()
+            mtime = (root / "x.snip").stat().st_mtime
+
+            self.assertEqual(tuple(_scan_snips(root)), ((root / "x.snip", mtime),))
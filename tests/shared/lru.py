@@ -0,0 +1,34 @@
+from unittest import TestCase
+
+from ...coq.shared.lru import LRU
+
+
+class Lru(TestCase):
+    def test_1(self) -> None:
+        lru: LRU[int, int] = LRU(size=2)
+        lru[1], lru[2], lru[3] = 1, 2, 3
+        self.assertEqual(tuple(lru.items()), ((2, 2), (3, 3)))
+
+    def test_2(self) -> None:
+        lru: LRU[int, int] = LRU(size=2)
+        lru[1], lru[2] = 1, 2
+        self.assertEqual(lru.get(1), 1)
+        lru[3] = 3
+        self.assertEqual(tuple(lru.items()), ((1, 1), (3, 3)))
+
+    def test_3(self) -> None:
+        lru: LRU[int, int] = LRU(size=2)
+        lru[1], lru[2] = 1, 2
+        lru[2] = 4
+        self.assertEqual(tuple(lru.items()), ((1, 1), (2, 4)))
+
+    def test_4(self) -> None:
+        lru: LRU[int, int] = LRU(size=2)
+        self.assertIsNone(lru.get(1))
+        self.assertNotIn(1, lru)
+
+    def test_5(self) -> None:
+        lru: LRU[int, int] = LRU(size=3)
+        lru[1], lru[2], lru[3] = 1, 2, 3
+        self.assertEqual(tuple(lru.items()), ((1, 1), (2, 2), (3, 3)))
+        self.assertEqual(tuple(lru.values()), (1, 2, 3))